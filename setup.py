@@ -40,6 +40,9 @@ setup(
             "flake8>=6.0.0",
             "mypy>=1.0.0",
         ],
+        "fast": [
+            "orjson>=3.0.0",
+        ],
     },
     include_package_data=True,
     keywords="vtt webvtt subtitles captions youtube live-stream hls m3u8",
@@ -0,0 +1,113 @@
+import pytest
+
+from vttkit.vtt_json.converter import (
+    cues_from_columnar,
+    cues_to_columnar,
+    build_cues_from_words,
+    parse_vtt_content,
+    split_long_cues,
+)
+
+
+def _words(*pairs):
+    return [{"word": word, "time": time} for time, word in pairs]
+
+
+def test_rebuild_trims_repeated_rolling_caption_prefix():
+    content = (
+        "WEBVTT\n\n"
+        "00:00:01.000 --> 00:00:03.000\n"
+        "so<00:00:01.500><c> hello</c><00:00:02.000><c> world</c>\n\n"
+        "00:00:03.000 --> 00:00:05.000\n"
+        "hello world<00:00:04.000><c> again</c>\n"
+    )
+    result = parse_vtt_content(content, rebuild_cues_from_words=True)
+    words = [w["word"] for cue in result["cues"] for w in cue["words"]]
+    assert words == ["so", "hello", "world", "again"]
+
+
+def test_columnar_cues_round_trip():
+    content = (
+        "WEBVTT\n\n"
+        "00:00:01.000 --> 00:00:03.000\n"
+        "hello<00:00:01.500><c> world</c>\n"
+    )
+    cues = parse_vtt_content(content)["cues"]
+    columnar = cues_to_columnar(cues)
+    assert columnar["columns"] == ["start_time", "end_time", "text", "words"]
+    assert cues_from_columnar(columnar) == cues
+
+
+@pytest.mark.parametrize("cue, max_duration, expected", [
+    # Words past the cue end: the last group ends at the cue end, before its start
+    (
+        {
+            "start_time": "00:00:00.000", "end_time": "00:00:05.000", "text": "a b c d e f",
+            "words": _words(("00:00:00.000", "a"), ("00:00:01.000", "b"), ("00:00:02.500", "c"),
+                            ("00:00:03.000", "d"), ("00:00:06.000", "e"), ("00:00:07.000", "f")),
+        },
+        2.0,
+        [
+            ("00:00:00.000", "00:00:01.000", "a"),
+            ("00:00:01.000", "00:00:03.000", "b c"),
+            ("00:00:03.000", "00:00:06.000", "d"),
+            ("00:00:06.000", "00:00:05.000", "e f"),
+        ],
+    ),
+    # 0.386 - 0.086 > 0.3 in floats although 0.086 + 0.3 == 0.386
+    (
+        {
+            "start_time": "00:00:00.086", "end_time": "00:00:01.000", "text": "a b c d e",
+            "words": _words(("00:00:00.086", "a"), ("00:00:00.200", "b"), ("00:00:00.386", "c"),
+                            ("00:00:00.500", "d"), ("00:00:00.900", "e")),
+        },
+        0.3,
+        [
+            ("00:00:00.086", "00:00:00.200", "a"),
+            ("00:00:00.200", "00:00:00.500", "b c"),
+            ("00:00:00.500", "00:00:00.900", "d"),
+            ("00:00:00.900", "00:00:01.000", "e"),
+        ],
+    ),
+    # The final group overflows on its own and becomes a single-group cue
+    (
+        {
+            "start_time": "00:00:00.000", "end_time": "00:00:04.500", "text": "a b x c d",
+            "words": _words(("00:00:00.000", "a"), ("00:00:00.500", "b"), ("00:00:00.500", "x"),
+                            ("00:00:01.500", "c"), ("00:00:03.000", "d")),
+        },
+        2.0,
+        [
+            ("00:00:00.000", "00:00:01.500", "a b x"),
+            ("00:00:01.500", "00:00:03.000", "c"),
+            ("00:00:03.000", "00:00:04.500", "d"),
+        ],
+    ),
+], ids=["words-past-cue-end", "float-rounding-boundary", "single-trailing-group"])
+def test_split_long_cues_chunk_boundaries(cue, max_duration, expected):
+    result = split_long_cues([cue], max_duration)
+    assert [(c["start_time"], c["end_time"], c["text"]) for c in result] == expected
+    assert [w for c in result for w in c["words"]] == cue["words"]
+
+
+@pytest.mark.parametrize("words, max_duration, expected", [
+    (
+        _words(("00:00:00.086", "a"), ("00:00:00.200", "b"),
+               ("00:00:00.386", "c"), ("00:00:00.500", "d")),
+        0.3,
+        [("00:00:00.086", "00:00:00.200", "a b"), ("00:00:00.386", "00:00:00.500", "c d")],
+    ),
+    (
+        _words(("00:00:01.000", "c"), ("00:00:00.000", "a"),
+               ("00:00:00.200", "b"), ("00:00:02.000", "d")),
+        0.3,
+        [
+            ("00:00:00.000", "00:00:00.200", "a b"),
+            ("00:00:01.000", "00:00:01.000", "c"),
+            ("00:00:02.000", "00:00:02.000", "d"),
+        ],
+    ),
+], ids=["float-rounding-boundary", "unsorted-single-trailing-word"])
+def test_build_cues_from_words_window_boundaries(words, max_duration, expected):
+    result = build_cues_from_words(words, max_duration)
+    assert [(c["start_time"], c["end_time"], c["text"]) for c in result] == expected
@@ -0,0 +1,104 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from vttkit.youtube import m3u8
+from vttkit.youtube.m3u8 import extract_m3u8_info
+
+
+def _playlist(segments, duration=2.0):
+    lines = [
+        "#EXTM3U",
+        "#EXT-X-MEDIA-SEQUENCE:42",
+        "#EXT-X-PROGRAM-DATE-TIME:2024-01-15T10:30:00.000Z",
+    ]
+    for i in range(segments):
+        lines += [f"#EXTINF:{duration},", f"seg{i}.ts"]
+    return ("\n".join(lines) + "\n").encode()
+
+
+@pytest.fixture
+def playlist_server():
+    state = {
+        "body": _playlist(3),
+        "etag": '"v1"',
+        "requests": [],
+        "cookies": [],
+        "connections": set(),
+    }
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            state["connections"].add(self.client_address)
+            state["requests"].append(self.headers.get("If-None-Match"))
+            state["cookies"].append(self.headers.get("Cookie"))
+            if state["etag"] and self.headers.get("If-None-Match") == state["etag"]:
+                self.send_response(304)
+                self.send_header("ETag", state["etag"])
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Set-Cookie", "session=abc; Path=/")
+            if state["etag"]:
+                self.send_header("ETag", state["etag"])
+            self.send_header("Content-Length", str(len(state["body"])))
+            self.end_headers()
+            self.wfile.write(state["body"])
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    m3u8._M3U8_CACHE.clear()
+    state["url"] = f"http://127.0.0.1:{server.server_address[1]}/live.m3u8"
+    yield state
+    server.shutdown()
+    server.server_close()
+    m3u8._M3U8_CACHE.clear()
+
+
+def test_not_modified_poll_returns_cached_copy(playlist_server):
+    first = extract_m3u8_info(playlist_server["url"])
+    first["media_sequence"] = None
+    second = extract_m3u8_info(playlist_server["url"])
+    assert playlist_server["requests"] == [None, '"v1"']
+    assert len(playlist_server["connections"]) == 1
+    assert second == {
+        "program_time": "2024-01-15T10:30:00.000Z",
+        "media_sequence": 42,
+        "segment_duration": 2.0,
+    }
+
+
+def test_expired_cache_entry_is_fetched_unconditionally(playlist_server):
+    # Entries live for two segment durations
+    playlist_server["body"] = _playlist(3, duration=0.001)
+    extract_m3u8_info(playlist_server["url"])
+    time.sleep(0.05)
+    extract_m3u8_info(playlist_server["url"])
+    assert playlist_server["requests"] == [None, None]
+
+
+def test_long_playlist_polls_reuse_one_connection(playlist_server):
+    # The whole playlist is read, so the connection goes back to the pool
+    playlist_server["etag"] = None
+    playlist_server["body"] = _playlist(200)
+    results = [extract_m3u8_info(playlist_server["url"]) for _ in range(5)]
+    assert all(result["media_sequence"] == 42 for result in results)
+    assert len(playlist_server["connections"]) == 1
+
+
+def test_polls_do_not_carry_cookies(playlist_server):
+    playlist_server["etag"] = None
+    extract_m3u8_info(playlist_server["url"])
+    extract_m3u8_info(playlist_server["url"])
+    assert playlist_server["cookies"] == [None, None]
@@ -0,0 +1,67 @@
+from vttkit import utils
+from vttkit.utils import (
+    PARALLEL_ENRICH_MIN_BLOCKS,
+    enrich_vtt_content_with_word_timestamps,
+    enrich_vtt_with_word_timestamps,
+)
+
+
+def test_enrich_keeps_start_time_when_equal_to_end_time():
+    content = "WEBVTT\n\n00:00:01.000 --> 00:00:01.000\nhello there world\n"
+    enriched = enrich_vtt_content_with_word_timestamps(content)
+    timestamp_line = enriched.split("\n")[2]
+    start_time, end_time = timestamp_line.split(" --> ")
+    assert start_time == "00:00:01.000"
+    assert end_time != "00:00:01.000"
+
+
+def test_enrich_preserves_cue_identifier():
+    content = "WEBVTT\n\n1\n00:00:01.000 --> 00:00:03.000\nhello world\n"
+    enriched = enrich_vtt_content_with_word_timestamps(content)
+    lines = enriched.split("\n")
+    assert lines[2] == "1"
+    assert lines[3].startswith("00:00:01.000 --> ")
+    assert lines[4].startswith("hello<")
+    assert lines[5] == "hello world"
+
+
+def test_enrich_process_pool_matches_serial():
+    cues = "\n\n".join(
+        f"00:00:{i % 60:02d}.000 --> 00:00:{i % 60:02d}.900\ncue number {i} here"
+        for i in range(PARALLEL_ENRICH_MIN_BLOCKS)
+    )
+    content = "WEBVTT\n\n" + cues + "\n"
+    serial = enrich_vtt_content_with_word_timestamps(content)
+    assert enrich_vtt_content_with_word_timestamps(content, max_workers=2) == serial
+
+
+def test_enrich_in_place_through_symlink_updates_target(tmp_path):
+    real = tmp_path / "real.vtt"
+    real.write_text("WEBVTT\n\n00:00:01.000 --> 00:00:03.000\nhello world\n", encoding="utf-8")
+    link = tmp_path / "link.vtt"
+    link.symlink_to(real)
+    enrich_vtt_with_word_timestamps(link)
+    assert link.is_symlink()
+    assert "<c> world</c>" in real.read_text(encoding="utf-8")
+
+
+def test_enrich_file_passes_max_workers_to_pool(tmp_path, monkeypatch):
+    pools = []
+
+    class RecordingPool(utils.ProcessPoolExecutor):
+        def __init__(self, max_workers=None):
+            pools.append(max_workers)
+            super().__init__(max_workers=max_workers)
+
+    monkeypatch.setattr(utils, "ProcessPoolExecutor", RecordingPool)
+    cues = "\n\n".join(
+        f"00:00:{i % 60:02d}.000 --> 00:00:{i % 60:02d}.900\ncue number {i} here"
+        for i in range(PARALLEL_ENRICH_MIN_BLOCKS)
+    )
+    content = "WEBVTT\n\n" + cues + "\n"
+    source = tmp_path / "in.vtt"
+    source.write_text(content, encoding="utf-8")
+    enrich_vtt_with_word_timestamps(source, tmp_path / "out.vtt", max_workers=2)
+    expected = enrich_vtt_content_with_word_timestamps(content)
+    assert pools == [2]
+    assert (tmp_path / "out.vtt").read_text(encoding="utf-8") == expected
@@ -55,6 +55,8 @@ from .vtt_json.converter import (
     clean_vtt_content,
     split_long_cues,
     build_cues_from_words,
+    cues_to_columnar,
+    cues_from_columnar,
 )
 
 # VTT to JSON conversion (from vtt_json package)
@@ -108,6 +110,8 @@ __all__ = [
     "clean_vtt_content",
     "split_long_cues",
     "build_cues_from_words",
+    "cues_to_columnar",
+    "cues_from_columnar",
     
     # Word timestamp estimation
     "estimate_word_timestamps",
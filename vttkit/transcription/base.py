@@ -6,6 +6,7 @@ segments.json structure and a minimal backend protocol.
 """
 
 from dataclasses import dataclass
+from operator import itemgetter
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from ..utils import seconds_to_timestamp
@@ -61,7 +62,7 @@ def _normalize_segments(raw_segments: Iterable[Any]) -> List[Dict[str, Any]]:
 def _group_words_by_start(words: List[Dict[str, Any]], precision: int = 3) -> List[List[Dict[str, Any]]]:
     if not words:
         return []
-    words_sorted = sorted(words, key=lambda w: w["start"])
+    words_sorted = sorted(words, key=itemgetter("start"))
     grouped: List[List[Dict[str, Any]]] = []
     current_group: List[Dict[str, Any]] = []
     current_key = None
@@ -5,14 +5,38 @@ Provides common utilities used across multiple modules, primarily
 timestamp conversion functions and word-level timestamp estimation.
 """
 
+import os
 import re
-from typing import List, Dict, Optional, Tuple
+import shutil
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from typing import List, Dict, Optional, Tuple, Union
 
+# Documents with at least this many blocks are enriched across a process pool
+PARALLEL_ENRICH_MIN_BLOCKS = 500
+PARALLEL_ENRICH_CHUNKSIZE = 64
 
+# Line prefixes that mark the VTT header block (checked in one startswith call)
+_HEADER_PREFIXES = ('WEBVTT', 'X-TIMESTAMP-MAP', 'Kind:', 'Language:')
+
+# Pre-compiled regex patterns shared by the enrichment functions
+# Support any number of hour digits for live streams with large offsets
+_TIMESTAMP_PATTERN = re.compile(r'(\d+:\d{2}:\d{2}\.\d{3}) --> (\d+:\d{2}:\d{2}\.\d{3})')
+_WORD_TIMESTAMP_PATTERN = re.compile(r'<\d+:\d{2}:\d{2}\.\d{3}><c>')
+_TAG_PATTERN = re.compile(r'<[^>]+>')
+
+
+@lru_cache(maxsize=8192)
 def timestamp_to_seconds(timestamp: str) -> float:
     """
     Convert HH:MM:SS.mmm format to seconds.
     
+    Results are memoized: cue boundaries and word times repeat heavily across
+    the parsing, normalization and end-time calculation stages.
+    
     Args:
         timestamp: Timestamp string in HH:MM:SS.mmm format
         
@@ -50,11 +74,48 @@ def seconds_to_timestamp(seconds: float) -> str:
     hours = int(seconds / 3600)
     minutes = int((seconds % 3600) / 60)
     seconds_remainder = seconds % 60
-    milliseconds = int((seconds_remainder - int(seconds_remainder)) * 1000)
+    whole_seconds = int(seconds_remainder)
+    milliseconds = int((seconds_remainder - whole_seconds) * 1000)
+    
+    # :02d is a minimum width: at least 2 digits for hours, more if needed
+    return f"{hours:02d}:{minutes:02d}:{whole_seconds:02d}.{milliseconds:03d}"
+
+
+def _timestamp_to_millis(timestamp: str) -> int:
+    """
+    Convert HH:MM:SS.mmm format to integer milliseconds.
+    
+    Integer-only counterpart of timestamp_to_seconds for callers that compare
+    or step timestamps at millisecond resolution, avoiding float rounding.
     
-    # Use at least 2 digits for hours, but allow more if needed
+    Args:
+        timestamp: Timestamp string in HH:MM:SS.mmm format
+        
+    Returns:
+        Time in milliseconds as int
+    """
+    hours, minutes, seconds = timestamp.split(":")
+    sec, millis = seconds.split(".")
+    total_seconds = int(hours) * 3600 + int(minutes) * 60 + int(sec)
+    return total_seconds * 1000 + int(millis)
+
+
+def _millis_to_timestamp(total_millis: int) -> str:
+    """
+    Convert integer milliseconds to HH:MM:SS.mmm format.
+    
+    Args:
+        total_millis: Time in milliseconds as int
+        
+    Returns:
+        Timestamp string in HH:MM:SS.mmm format (or HHH+:MM:SS.mmm for >99 hours)
+    """
+    hours = total_millis // 3_600_000
+    minutes = (total_millis % 3_600_000) // 60_000
+    seconds = (total_millis % 60_000) // 1000
+    millis = total_millis % 1000
     hours_str = f"{hours:02d}" if hours < 100 else str(hours)
-    return f"{hours_str}:{minutes:02d}:{int(seconds_remainder):02d}.{milliseconds:03d}"
+    return f"{hours_str}:{minutes:02d}:{seconds:02d}.{millis:03d}"
 
 
 def estimate_word_timestamps(cue_start: str, cue_end: str, text: str) -> List[Dict[str, str]]:
@@ -94,10 +155,11 @@ def estimate_word_timestamps(cue_start: str, cue_end: str, text: str) -> List[Di
     except ImportError:
         use_syllables = False
     
-    # Split into words
-    words = text.split()
+    # Split into words (interned: transcripts reuse a small vocabulary heavily)
+    words = [sys.intern(word) for word in text.split()]
     if not words:
         return []
+    num_words = len(words)
     
     # Calculate total duration
     start_sec = timestamp_to_seconds(cue_start)
@@ -105,14 +167,14 @@ def estimate_word_timestamps(cue_start: str, cue_end: str, text: str) -> List[Di
     total_duration = end_sec - start_sec
     
     # Edge case: single word
-    if len(words) == 1:
+    if num_words == 1:
         return [{"word": words[0], "time": cue_start}]
     
-    # Calculate weights for each word
-    word_weights = []
-    pause_weights = []
+    # Calculate weights for each word (lists are pre-sized, one slot per word)
+    word_weights = [0] * num_words
+    pause_weights = [0.0] * num_words
     
-    for word in words:
+    for i, word in enumerate(words):
         # Clean word for syllable/character counting (remove punctuation)
         clean_word = word.strip('.,!?;:\'"')
         
@@ -129,19 +191,17 @@ def estimate_word_timestamps(cue_start: str, cue_end: str, text: str) -> List[Di
             # Fallback to character count
             weight = max(1, len(clean_word))
         
-        word_weights.append(weight)
+        word_weights[i] = weight
         
         # Detect punctuation for pause weights
-        pause = 0.0
         if word.endswith((',', ';')):
-            pause = 0.1  # 100ms for comma/semicolon
+            pause_weights[i] = 0.1  # 100ms for comma/semicolon
         elif word.endswith(('.', '!', '?')):
-            pause = 0.2  # 200ms for sentence-ending punctuation
-        pause_weights.append(pause)
+            pause_weights[i] = 0.2  # 200ms for sentence-ending punctuation
     
     # Calculate time distribution
     baseline_per_word = 0.15  # 150ms minimum per word
-    total_baseline = baseline_per_word * len(words)
+    total_baseline = baseline_per_word * num_words
     total_pauses = sum(pause_weights)
     total_weight = sum(word_weights)
     
@@ -153,7 +213,7 @@ def estimate_word_timestamps(cue_start: str, cue_end: str, text: str) -> List[Di
         remaining_time = 0
     
     # Generate timestamps for each word
-    result = []
+    result: List[Dict[str, str]] = []
     current_time = start_sec
     
     for i, (word, weight, pause) in enumerate(zip(words, word_weights, pause_weights)):
@@ -168,7 +228,7 @@ def estimate_word_timestamps(cue_start: str, cue_end: str, text: str) -> List[Di
         word_duration += pause
         
         # Ensure last word ends exactly at cue_end
-        if i == len(words) - 1:
+        if i == num_words - 1:
             word_duration = end_sec - current_time
         
         # Create word timestamp entry
@@ -220,23 +280,23 @@ def _normalize_word_timings(words: List[Dict[str, str]], start_time: str) -> Lis
     if not words:
         return words
     
-    normalized = []
+    normalized: List[Dict[str, str]] = []
     last_time_seconds = timestamp_to_seconds(start_time)
     
-    for word in words:
+    for i, word in enumerate(words):
         word_time_seconds = timestamp_to_seconds(word['time'])
         
         # If word is at/before last time, push it forward
         if word_time_seconds <= last_time_seconds:
-            if normalized:
+            if i > 0:
                 # Use previous word's estimated duration as spacing
-                prev_duration = _estimate_word_duration(normalized[-1]['word'])
+                prev_duration = _estimate_word_duration(words[i - 1]['word'])
                 word_time_seconds = last_time_seconds + prev_duration
             else:
                 word_time_seconds = last_time_seconds
         
         normalized.append({
-            'word': word['word'],
+            'word': sys.intern(word['word']),
             'time': seconds_to_timestamp(word_time_seconds)
         })
         last_time_seconds = word_time_seconds
@@ -310,33 +370,108 @@ def format_cue_with_word_timestamps(start_time: str, end_time: str, words: List[
     corrected_end_time = _calculate_cue_end_time(normalized_words, end_time)
     
     # Step 3: Format VTT content (existing logic with normalized words)
-    # Build word-level timestamp line and collect plain words
+    # Build word-level timestamp line and plain text line as one flat list of
+    # fragments so the whole cue is produced by a single ''.join
     # Format: first_word<timestamp2><c> word2</c><timestamp3><c> word3</c>
     # Space appears AFTER <c> tag (before the word text inside the tag)
-    formatted_parts = []
-    plain_words = []
+    plain_words = [word["word"] for word in normalized_words]
+    parts = [plain_words[0]]
     
-    for i, word in enumerate(normalized_words):
-        timestamp = word["time"]
+    for word in normalized_words[1:]:
         word_text = word["word"]
-        plain_words.append(word_text)
-        
-        if i == 0:
-            # First word: just the plain text (no tags)
-            formatted_parts.append(word_text)
-        else:
-            # Subsequent words: <timestamp><c> word</c> (space INSIDE <c> tag)
-            formatted_parts.append(f"<{timestamp}><c> {word_text}</c>")
+        # Subsequent words: <timestamp><c> word</c> (space INSIDE <c> tag)
+        parts.extend(('<', word["time"], '><c> ', word_text, '</c>'))
     
-    # Join without spaces since spaces are inside <c> tags
-    word_timestamp_line = "".join(formatted_parts)
-    plain_text_line = " ".join(plain_words)
-    content = f"{word_timestamp_line}\n{plain_text_line}"
+    # Second line: plain text sentence for fallback/readability
+    parts.append('\n')
+    parts.append(' '.join(plain_words))
+    content = ''.join(parts)
     
     return (content, corrected_end_time)
 
 
-def enrich_vtt_content_with_word_timestamps(vtt_content: str) -> str:
+def _enrich_block(block: str, has_word_timestamps: bool = True) -> str:
+    """
+    Enrich a single VTT block with estimated word-level timestamps.
+    
+    Module-level (picklable) so it can run in worker processes. Header blocks,
+    blocks without a cue timestamp, already-enriched cues and empty cues are
+    returned unchanged.
+    
+    Args:
+        block: One non-empty VTT block (header or cue)
+        has_word_timestamps: Whether the document contains any word timestamps
+            (if False, the per-block "already enriched" check is skipped)
+        
+    Returns:
+        The block, enriched with <timestamp><c>word</c> tags if applicable
+    """
+    # Already has word timestamps, keep as-is without splitting it into lines
+    if has_word_timestamps and _WORD_TIMESTAMP_PATTERN.search(block):
+        return block
+    
+    lines = block.strip().split('\n')
+    
+    # Check if this is the header block (starts with WEBVTT or contains metadata)
+    if lines[0].startswith(_HEADER_PREFIXES):
+        return block
+    
+    # Try to find timestamp line
+    timestamp_line_idx = None
+    timestamp_match = None
+    
+    for i, line in enumerate(lines):
+        match = _TIMESTAMP_PATTERN.search(line)
+        if match:
+            timestamp_line_idx = i
+            timestamp_match = match
+            break
+    
+    # If no timestamp found, keep block as-is
+    if timestamp_match is None:
+        return block
+    
+    start_time = timestamp_match.group(1)
+    end_time = timestamp_match.group(2)
+    
+    # Get text content (everything after timestamp line)
+    text_lines = lines[timestamp_line_idx + 1:]
+    text_content = ' '.join(text_lines)
+    
+    # Clean text (remove any existing tags)
+    clean_text = _TAG_PATTERN.sub('', text_content)
+    clean_text = clean_text.strip()
+    
+    if not clean_text:
+        # Empty text, keep as-is
+        return block
+    
+    # Estimate word timestamps
+    words = estimate_word_timestamps(start_time, end_time, clean_text)
+    
+    # Format with word timestamps and get corrected end time
+    enriched_text, corrected_end_time = format_cue_with_word_timestamps(start_time, end_time, words)
+    
+    # Rebuild the block with enriched content and corrected timestamp
+    # Keep identifier (if any), then the timestamp line with corrected end time.
+    # Splice at the end timestamp's match span rather than str.replace, which
+    # would also rewrite the start time when both timestamps are identical.
+    timestamp_line = lines[timestamp_line_idx]
+    end_start, end_stop = timestamp_match.span(2)
+    parts: List[str] = []
+    for line in lines[:timestamp_line_idx]:
+        parts.extend((line, '\n'))
+    parts.extend((
+        timestamp_line[:end_start], corrected_end_time, timestamp_line[end_stop:],
+        '\n', enriched_text
+    ))
+    return ''.join(parts)
+
+
+def enrich_vtt_content_with_word_timestamps(
+    vtt_content: str,
+    max_workers: Optional[int] = None
+) -> str:
     """
     Enrich VTT content string by adding estimated word-level timestamps to cues that lack them.
     
@@ -344,8 +479,16 @@ def enrich_vtt_content_with_word_timestamps(vtt_content: str) -> str:
     Detects cues without word-level timestamps, estimates timestamps using syllable-based
     distribution, and returns enriched VTT content with <timestamp><c>word</c> tags.
     
+    Cues are independent, so callers can opt in to enriching large documents
+    (at least PARALLEL_ENRICH_MIN_BLOCKS blocks) across a process pool by
+    passing max_workers > 1; output order is preserved. The pool is off by
+    default because it needs an importable __main__ under the spawn start
+    method and cannot be started from daemonic worker processes.
+    
     Args:
         vtt_content: VTT content as string
+        max_workers: Worker processes for large documents (default: None, which
+            like 1 enriches serially in the calling process)
         
     Returns:
         Enriched VTT content string with word-level timestamps
@@ -358,79 +501,23 @@ def enrich_vtt_content_with_word_timestamps(vtt_content: str) -> str:
         >>> "<c> world</c>" in enriched  # Subsequent words have <c> tags with leading space
         True
     """
-    # Split into blocks (header + cues)
-    blocks = vtt_content.strip().split('\n\n')
-    
-    # Pattern to match VTT cue timestamps (supports any number of hour digits for live streams)
-    timestamp_pattern = re.compile(r'(\d+:\d{2}:\d{2}\.\d{3}) --> (\d+:\d{2}:\d{2}\.\d{3})')
-    # Pattern to detect existing word timestamps (supports any number of hour digits)
-    word_timestamp_pattern = re.compile(r'<\d+:\d{2}:\d{2}\.\d{3}><c>')
-    
-    enriched_blocks = []
-    
-    for block in blocks:
-        if not block.strip():
-            continue
-        
-        lines = block.strip().split('\n')
-        
-        # Check if this is the header block (starts with WEBVTT or contains metadata)
-        if lines[0].startswith('WEBVTT') or lines[0].startswith('X-TIMESTAMP-MAP') or lines[0].startswith('Kind:') or lines[0].startswith('Language:'):
-            enriched_blocks.append(block)
-            continue
-        
-        # Try to find timestamp line
-        timestamp_line_idx = None
-        timestamp_match = None
-        
-        for i, line in enumerate(lines):
-            match = timestamp_pattern.search(line)
-            if match:
-                timestamp_line_idx = i
-                timestamp_match = match
-                break
-        
-        # If no timestamp found, keep block as-is
-        if timestamp_match is None:
-            enriched_blocks.append(block)
-            continue
-        
-        start_time = timestamp_match.group(1)
-        end_time = timestamp_match.group(2)
-        
-        # Get text content (everything after timestamp line)
-        text_lines = lines[timestamp_line_idx + 1:]
-        text_content = ' '.join(text_lines)
-        
-        # Check if already has word timestamps
-        if word_timestamp_pattern.search(text_content):
-            # Already has word timestamps, keep as-is
-            enriched_blocks.append(block)
-            continue
-        
-        # Clean text (remove any existing tags)
-        clean_text = re.sub(r'<[^>]+>', '', text_content)
-        clean_text = clean_text.strip()
-        
-        if not clean_text:
-            # Empty text, keep as-is
-            enriched_blocks.append(block)
-            continue
-        
-        # Estimate word timestamps
-        words = estimate_word_timestamps(start_time, end_time, clean_text)
-        
-        # Format with word timestamps and get corrected end time
-        enriched_text, corrected_end_time = format_cue_with_word_timestamps(start_time, end_time, words)
-        
-        # Rebuild the block with enriched content and corrected timestamp
-        new_block_lines = lines[:timestamp_line_idx]  # Keep identifier (if any)
-        # Update timestamp line with corrected end time
-        timestamp_line = lines[timestamp_line_idx]
-        corrected_timestamp_line = timestamp_line.replace(end_time, corrected_end_time)
-        new_block_lines.append(corrected_timestamp_line)
-        new_block_lines.append(enriched_text)
-        enriched_blocks.append('\n'.join(new_block_lines))
+    # Split into blocks (header + cues), dropping empty ones
+    blocks = [block for block in vtt_content.strip().split('\n\n') if block.strip()]
+    
+    # One scan up front: files without any word timestamps (the common
+    # un-enriched case) skip the per-block "already enriched" check entirely
+    has_word_timestamps = _WORD_TIMESTAMP_PATTERN.search(vtt_content) is not None
+    
+    if max_workers is not None and max_workers > 1 and len(blocks) >= PARALLEL_ENRICH_MIN_BLOCKS:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            enriched_blocks = list(executor.map(
+                _enrich_block,
+                blocks,
+                repeat(has_word_timestamps),
+                chunksize=PARALLEL_ENRICH_CHUNKSIZE
+            ))
+    else:
+        enriched_blocks = [_enrich_block(block, has_word_timestamps) for block in blocks]
     
     # Build enriched VTT content
     enriched_content = '\n\n'.join(enriched_blocks)
@@ -441,8 +528,9 @@ def enrich_vtt_content_with_word_timestamps(vtt_content: str) -> str:
 
 
 def enrich_vtt_with_word_timestamps(
-    input_vtt_path: str,
-    output_vtt_path: Optional[str] = None
+    input_vtt_path: Union[str, os.PathLike],
+    output_vtt_path: Optional[Union[str, os.PathLike]] = None,
+    max_workers: Optional[int] = None
 ) -> Dict[str, int]:
     """
     Enrich a VTT file by adding estimated word-level timestamps to cues that lack them.
@@ -451,9 +539,16 @@ def enrich_vtt_with_word_timestamps(
     using syllable-based distribution, and writes an enriched VTT file with
     <timestamp><c>word</c> tags.
     
+    In-place enrichment writes to a temporary file next to the resolved input
+    and atomically replaces it, so a failure never leaves a half-written VTT
+    behind. Symlinks are followed; a file with other hard links is written
+    through instead so every link sees the enriched content.
+    
     Args:
         input_vtt_path: Path to input VTT file
         output_vtt_path: Path to output VTT file (defaults to input_vtt_path if None)
+        max_workers: Worker processes for large files, passed to
+            enrich_vtt_content_with_word_timestamps (default: None, serial)
         
     Returns:
         Dictionary with statistics:
@@ -476,12 +571,9 @@ def enrich_vtt_with_word_timestamps(
         content = f.read()
     
     # Use string-based enrichment
-    enriched_content = enrich_vtt_content_with_word_timestamps(content)
+    enriched_content = enrich_vtt_content_with_word_timestamps(content, max_workers=max_workers)
     
     # Calculate statistics for backward compatibility
-    timestamp_pattern = re.compile(r'(\d+:\d{2}:\d{2}\.\d{3}) --> (\d+:\d{2}:\d{2}\.\d{3})')
-    word_timestamp_pattern = re.compile(r'<\d+:\d{2}:\d{2}\.\d{3}><c>')
-    
     original_blocks = content.strip().split('\n\n')
     enriched_blocks = enriched_content.strip().split('\n\n')
     
@@ -490,16 +582,36 @@ def enrich_vtt_with_word_timestamps(
     cues_skipped = 0
     
     for orig_block, enr_block in zip(original_blocks, enriched_blocks):
-        if timestamp_pattern.search(orig_block):
+        if _TIMESTAMP_PATTERN.search(orig_block):
             cues_processed += 1
-            if word_timestamp_pattern.search(orig_block):
+            if _WORD_TIMESTAMP_PATTERN.search(orig_block):
                 cues_skipped += 1
-            elif word_timestamp_pattern.search(enr_block):
+            elif _WORD_TIMESTAMP_PATTERN.search(enr_block):
                 cues_enriched += 1
     
     # Write enriched VTT
-    with open(output_vtt_path, 'w', encoding='utf-8') as f:
-        f.write(enriched_content)
+    encoded = enriched_content.encode('utf-8')
+    in_place = os.path.exists(output_vtt_path) and os.path.samefile(input_vtt_path, output_vtt_path)
+    # Resolve symlinks so the real file is replaced, not the link
+    target_path = os.path.realpath(output_vtt_path)
+    if in_place and os.stat(target_path).st_nlink == 1:
+        # In-place: write alongside the resolved input, then atomically swap it in
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(target_path),
+            suffix='.vtt.tmp'
+        )
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(encoded)
+            shutil.copymode(target_path, tmp_path)
+            os.replace(tmp_path, target_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    else:
+        # New output, or a hard-linked input that a replace would detach
+        with open(output_vtt_path, 'wb') as f:
+            f.write(encoded)
     
     return {
         "cues_processed": cues_processed,
@@ -10,6 +10,8 @@ from .converter import (
     parse_vtt_content,
     parse_vtt,
     format_transcript_with_timestamps,
+    cues_to_columnar,
+    cues_from_columnar,
 )
 
 from .parser import VTTParser
@@ -19,6 +21,8 @@ __all__ = [
     "parse_vtt_content",
     "parse_vtt",
     "format_transcript_with_timestamps",
+    "cues_to_columnar",
+    "cues_from_columnar",
     
     # Parser class
     "VTTParser",
@@ -6,11 +6,18 @@ data with word-level timestamps. This module focuses on low-level VTT parsing
 operations and includes all VTT-specific utility functions.
 """
 
+import math
 import re
-from itertools import groupby
-from typing import Dict, List, Optional, Any, Tuple
+from bisect import bisect_left, bisect_right
+from operator import itemgetter, le
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Tuple
 
-from ..utils import timestamp_to_seconds, seconds_to_timestamp
+from ..utils import (
+    timestamp_to_seconds,
+    seconds_to_timestamp,
+    _timestamp_to_millis,
+    _millis_to_timestamp,
+)
 
 # Constants
 DEFAULT_MAX_CUE_DURATION = 2.0
@@ -19,10 +26,19 @@ TIMESTAMP_ALIGNMENT_TOLERANCE = 0.05  # seconds
 # Pre-compiled regex patterns for performance
 # Support any number of hour digits for live streams with large offsets
 _TIMESTAMP_PATTERN = re.compile(r'(\d+:\d{2}:\d{2}\.\d{3}) --> (\d+:\d{2}:\d{2}\.\d{3})')
-_CONTENT_PATTERN = re.compile(r'.*<\d+:\d{2}:\d{2}\.\d{3}>.*')
 _TAG_PATTERN = re.compile(r'<(\d+:\d{2}:\d{2}\.\d{3})><c>([^<]*)</c>')
 _CLEAN_TEXT_PATTERN = re.compile(r'<\d+:\d{2}:\d{2}\.\d{3}>|</?c>')
 _SPEAKER_MARKER_PATTERN = re.compile(r'(^|\s)(>>|&gt;&gt;)\s*')
+# Normalized HH:MM:SS.mmm (ASCII digits, minutes and seconds below 60)
+_START_FIELDS_PATTERN = re.compile(r'([0-9]+):([0-5][0-9]):([0-5][0-9])\.[0-9]{3}')
+
+# C-level accessors for word fields
+_get_word = itemgetter('word')
+_get_time = itemgetter('time')
+
+# Cue keys in the order used by the columnar segments.json layout
+_CUE_COLUMNS = ('start_time', 'end_time', 'text', 'words')
+_get_cue_row = itemgetter(*_CUE_COLUMNS)
 
 
 def _resolve_inner_timestamp(tag_timestamp: str, base_seconds: float) -> str:
@@ -56,15 +72,48 @@ def _calculate_middle_timestamp(syllable_list: List[Tuple[str, str]]) -> str:
     if len(syllable_list) == 1:
         return syllable_list[0][0]
     
-    # Convert all timestamps to seconds
-    timestamps_seconds = [timestamp_to_seconds(ts) for ts, _ in syllable_list]
-    
-    # Calculate middle (average of first and last)
-    middle_seconds = (timestamps_seconds[0] + timestamps_seconds[-1]) / 2
+    # Calculate middle (average of first and last); only those two
+    # timestamps need converting
+    first_seconds = timestamp_to_seconds(syllable_list[0][0])
+    last_seconds = timestamp_to_seconds(syllable_list[-1][0])
+    middle_seconds = (first_seconds + last_seconds) / 2
     
     return seconds_to_timestamp(middle_seconds)
 
 
+def _iter_cue_lines(lines: Iterable[str]) -> Iterator[List[str]]:
+    """
+    Group raw VTT lines into cues, keeping only timestamp lines and their content.
+    
+    Lines are consumed lazily, so a file object can be passed directly.
+    
+    Args:
+        lines: Iterable of raw VTT lines
+        
+    Yields:
+        Lists of stripped lines: the timestamp line followed by its content lines.
+        Timestamps without content are dropped.
+    """
+    current_lines: List[str] = []
+
+    for raw_line in lines:
+        line = raw_line.strip()
+        if not line:
+            continue
+        # Cheap substring test first: most lines are cue text, and a
+        # timestamp line must contain the arrow
+        if ' --> ' in line and _TIMESTAMP_PATTERN.match(line):
+            if len(current_lines) > 1:
+                yield current_lines
+            current_lines = [line]
+            continue
+        if current_lines:
+            current_lines.append(line)
+
+    if len(current_lines) > 1:
+        yield current_lines
+
+
 def clean_vtt_content(content: str) -> str:
     """
     Clean a VTT content by keeping only timestamp lines and formatted content lines.
@@ -82,33 +131,42 @@ def clean_vtt_content(content: str) -> str:
     if not content or not content.strip():
         raise ValueError("VTT content cannot be empty")
     
-    # Split content into lines
-    lines = content.strip().split('\n')
-
-    # Group consecutive content lines under their timestamp
-    cues: List[Tuple[str, List[str]]] = []
-    current_timestamp: Optional[str] = None
-    current_lines: List[str] = []
-
-    for raw_line in lines:
-        line = raw_line.strip()
-        if not line:
-            continue
-        if _TIMESTAMP_PATTERN.match(line):
-            if current_timestamp and current_lines:
-                cues.append((current_timestamp, current_lines))
-            current_timestamp = line
-            current_lines = []
-            continue
-        if current_timestamp:
-            current_lines.append(line)
-
-    if current_timestamp and current_lines:
-        cues.append((current_timestamp, current_lines))
-
-    # Format the output to be a valid VTT
-    blocks = [f"{timestamp}\n" + "\n".join(content_lines) for timestamp, content_lines in cues]
-    return "WEBVTT\n\n" + "\n\n".join(blocks)
+    # Group consecutive content lines under their timestamp and format the
+    # output to be a valid VTT, joining blocks straight from the generator
+    cues = _iter_cue_lines(content.split('\n'))
+    return "WEBVTT\n\n" + "\n\n".join(map("\n".join, cues))
+
+
+def _find_window_end(
+    sorted_times: List[float],
+    window_start: float,
+    max_duration: float,
+    lo: int,
+    hi: int
+) -> int:
+    """
+    Find the first time in sorted_times[lo:hi] more than max_duration after window_start.
+    
+    Bisects to the boundary, then re-checks neighbours with the exact
+    `time - window_start > max_duration` comparison so float rounding in
+    `window_start + max_duration` cannot move it.
+    
+    Args:
+        sorted_times: Times in seconds, sorted within [lo, hi)
+        window_start: Window start time in seconds
+        max_duration: Maximum window duration in seconds
+        lo: First index to consider
+        hi: End of the index range to consider
+        
+    Returns:
+        Index of the first time past the window, or hi if all fit
+    """
+    index = bisect_right(sorted_times, window_start + max_duration, lo, hi)
+    while index > lo and sorted_times[index - 1] - window_start > max_duration:
+        index -= 1
+    while index < hi and not sorted_times[index] - window_start > max_duration:
+        index += 1
+    return index
 
 
 def split_long_cues(cues: List[Dict[str, Any]], max_duration: float = DEFAULT_MAX_CUE_DURATION) -> List[Dict[str, Any]]:
@@ -119,14 +177,35 @@ def split_long_cues(cues: List[Dict[str, Any]], max_duration: float = DEFAULT_MA
         cues: List of cue dictionaries
         max_duration: Maximum duration in seconds for each cue
         
+    Returns:
+        List of cues with long cues split into shorter ones
+    """
+    cue_seconds = [
+        (timestamp_to_seconds(cue['start_time']), timestamp_to_seconds(cue['end_time']))
+        for cue in cues
+    ]
+    return _split_long_cues(cues, cue_seconds, max_duration)
+
+
+def _split_long_cues(
+    cues: List[Dict[str, Any]],
+    cue_seconds: List[Tuple[float, float]],
+    max_duration: float
+) -> List[Dict[str, Any]]:
+    """
+    Split long cues given their start and end times already in seconds.
+    
+    Args:
+        cues: List of cue dictionaries
+        cue_seconds: (start, end) seconds for each cue, parallel to cues
+        max_duration: Maximum duration in seconds for each cue
+        
     Returns:
         List of cues with long cues split into shorter ones
     """
     new_cues = []
     
-    for cue in cues:
-        start_time = timestamp_to_seconds(cue['start_time'])
-        end_time = timestamp_to_seconds(cue['end_time'])
+    for cue, (start_time, end_time) in zip(cues, cue_seconds):
         duration = end_time - start_time
         
         # If cue is already short enough, keep it
@@ -134,20 +213,30 @@ def split_long_cues(cues: List[Dict[str, Any]], max_duration: float = DEFAULT_MA
             new_cues.append(cue)
             continue
         
-        # Sort words by timestamp - cache the conversion in a dict
-        word_times = {id(w): timestamp_to_seconds(w['time']) for w in cue['words']}
-        words = sorted(cue['words'], key=lambda w: word_times[id(w)])
+        # Sort words by timestamp, keeping their times in a parallel array
+        # (structure-of-arrays) so later passes index floats instead of dicts.
+        # Parsed cues list their words in time order, so the sort is usually skipped
+        words = cue['words']
+        word_seconds = list(map(timestamp_to_seconds, map(_get_time, words)))
+        if not all(map(le, word_seconds, word_seconds[1:])):
+            order = sorted(range(len(words)), key=word_seconds.__getitem__)
+            words = [words[i] for i in order]
+            word_seconds = [word_seconds[i] for i in order]
         
-        # Group words by exact same timestamp
+        # Group words by exact same timestamp: a group ends wherever the
+        # timestamp string changes, so each group is a slice of the sorted words
         word_groups = []
-        for timestamp, group in groupby(words, key=lambda w: w['time']):
-            word_group = list(group)
-            timestamp_seconds = timestamp_to_seconds(timestamp)
+        num_words = len(words)
+        group_start = 0
+        for i in range(1, num_words + 1):
+            if i < num_words and words[i]['time'] == words[group_start]['time']:
+                continue
             word_groups.append({
-                'timestamp': timestamp,
-                'timestamp_seconds': timestamp_seconds,
-                'words': word_group
+                'timestamp': words[group_start]['time'],
+                'timestamp_seconds': word_seconds[group_start],
+                'words': words[group_start:i]
             })
+            group_start = i
         
         # If no words or just one group, split evenly
         if len(word_groups) <= 1:
@@ -159,8 +248,11 @@ def split_long_cues(cues: List[Dict[str, Any]], max_duration: float = DEFAULT_MA
                 chunk_end = min(start_time + ((i + 1) * chunk_duration), end_time)
                 
                 # Create new cue
-                # Use cached word_times for filtering
-                chunk_words = [w for w in words if chunk_start <= word_times[id(w)] < chunk_end]
+                # word_seconds is sorted, so the words with
+                # chunk_start <= t < chunk_end form one contiguous slice
+                chunk_words = words[
+                    bisect_left(word_seconds, chunk_start):bisect_left(word_seconds, chunk_end)
+                ]
                 new_cue = {
                     'start_time': seconds_to_timestamp(chunk_start),
                     'end_time': seconds_to_timestamp(chunk_end),
@@ -169,65 +261,49 @@ def split_long_cues(cues: List[Dict[str, Any]], max_duration: float = DEFAULT_MA
                 }
                 new_cues.append(new_cue)
         else:
-            # Group words into chunks of max_duration, keeping same-timestamp words together
-            current_chunk_word_groups = []
-            current_chunk_words = []
-            current_chunk_start = start_time
-            last_word_end = start_time
-            current_chunk_duration = 0
+            # Group words into chunks of max_duration, keeping same-timestamp words together.
+            # Each group ends where the next one starts; the last ends at the cue end.
+            group_seconds = [group['timestamp_seconds'] for group in word_groups]
+            group_ends = group_seconds[1:] + [end_time]
+            num_groups = len(word_groups)
+            last_group = num_groups - 1
+            chunk_start = start_time
+            first_group = 0
             
-            for i, group in enumerate(word_groups):
-                group_time = group['timestamp_seconds']
-                group_words = group['words']
-                
-                # Calculate end time for this group
-                if i < len(word_groups) - 1:
-                    next_group_time = word_groups[i+1]['timestamp_seconds']
-                    group_end = next_group_time
-                else:
-                    # Last group ends at the cue end time
-                    group_end = end_time
+            while first_group < num_groups:
+                # A chunk always takes its first group, then every following group
+                # whose end is within max_duration of the chunk start. group_ends is
+                # sorted apart from its final entry (the cue end, which words may
+                # overrun), so search the sorted part and check the last group alone
+                next_group = _find_window_end(
+                    group_ends, chunk_start, max_duration, first_group + 1, last_group
+                )
+                if (next_group == last_group
+                        and not group_ends[last_group] - chunk_start > max_duration):
+                    next_group = num_groups
                 
-                group_duration = group_end - group_time
-                potential_chunk_duration = (group_end - current_chunk_start)
+                chunk_words = [
+                    w for group in word_groups[first_group:next_group] for w in group['words']
+                ]
+                chunk_text = " ".join(map(_get_word, chunk_words))
                 
-                # Check if adding this group would exceed max_duration and we have already added some words
-                if potential_chunk_duration > max_duration and current_chunk_words:
-                    # Create a new cue with current chunk
-                    chunk_words = [w for group in current_chunk_word_groups for w in group['words']]
-                    chunk_text = " ".join([w['word'] for w in chunk_words])
-                    
-                    new_cue = {
-                        'start_time': seconds_to_timestamp(current_chunk_start),
-                        'end_time': seconds_to_timestamp(last_word_end),
-                        'text': chunk_text,
-                        'words': chunk_words
-                    }
-                    new_cues.append(new_cue)
-                    
-                    # Start a new chunk with this group
-                    current_chunk_word_groups = []
-                    current_chunk_words = []
-                    current_chunk_start = group_time
-                    current_chunk_duration = 0
-                
-                # Add the current group to the chunk
-                current_chunk_word_groups.append(group)
-                current_chunk_words.extend(group_words)
-                last_word_end = group_end
-                current_chunk_duration = last_word_end - current_chunk_start
-            
-            # Add the final chunk if it has words
-            if current_chunk_words:
-                chunk_text = " ".join([w['word'] for w in current_chunk_words])
+                if next_group < num_groups:
+                    chunk_end_timestamp = seconds_to_timestamp(group_ends[next_group - 1])
+                else:
+                    # The final chunk runs to the cue end time
+                    chunk_end_timestamp = cue['end_time']
                 
                 new_cue = {
-                    'start_time': seconds_to_timestamp(current_chunk_start),
-                    'end_time': cue['end_time'],
+                    'start_time': seconds_to_timestamp(chunk_start),
+                    'end_time': chunk_end_timestamp,
                     'text': chunk_text,
-                    'words': current_chunk_words
+                    'words': chunk_words
                 }
                 new_cues.append(new_cue)
+                
+                if next_group < num_groups:
+                    chunk_start = group_seconds[next_group]
+                first_group = next_group
     
     return new_cues
 
@@ -246,43 +322,31 @@ def build_cues_from_words(words: List[Dict[str, Any]], max_cue_duration: float =
     if not words:
         return []
 
-    # Cache timestamp conversions and sort with stable index
-    word_times = [(timestamp_to_seconds(w["time"]), i, w) for i, w in enumerate(words)]
-    word_times.sort(key=lambda item: (item[0], item[1]))
+    # Cache timestamp conversions; words from parse_vtt_content are usually
+    # already in time order, so only sort (stably) when they are not
+    word_seconds = list(map(timestamp_to_seconds, map(_get_time, words)))
+    if not all(map(le, word_seconds, word_seconds[1:])):
+        order = sorted(range(len(words)), key=word_seconds.__getitem__)
+        words = [words[i] for i in order]
+        word_seconds = [word_seconds[i] for i in order]
 
+    # Each cue is an index span of the sorted words, sliced out once
     cues = []
-    current_words = []
-    segment_start = None
-    segment_end = None
-
-    for word_time, _, word in word_times:
-        if segment_start is None:
-            segment_start = word_time
-            segment_end = word_time
-            current_words = [word]
-            continue
-
-        if word_time - segment_start > max_cue_duration:
-            cues.append({
-                "start_time": seconds_to_timestamp(segment_start),
-                "end_time": seconds_to_timestamp(segment_end),
-                "text": " ".join([w["word"] for w in current_words]).strip(),
-                "words": current_words,
-            })
-            current_words = [word]
-            segment_start = word_time
-            segment_end = word_time
-        else:
-            current_words.append(word)
-            segment_end = word_time
-
-    if current_words:
+    num_words = len(words)
+    span_start = 0
+    while span_start < num_words:
+        segment_start = word_seconds[span_start]
+        span_end = _find_window_end(
+            word_seconds, segment_start, max_cue_duration, span_start + 1, num_words
+        )
+        current_words = words[span_start:span_end]
         cues.append({
             "start_time": seconds_to_timestamp(segment_start),
-            "end_time": seconds_to_timestamp(segment_end),
-            "text": " ".join([w["word"] for w in current_words]).strip(),
+            "end_time": seconds_to_timestamp(word_seconds[span_end - 1]),
+            "text": " ".join(map(_get_word, current_words)).strip(),
             "words": current_words,
         })
+        span_start = span_end
 
     return cues
 
@@ -315,17 +379,43 @@ def _clean_text(text: str) -> str:
     Returns:
         Clean text without tags
     """
-    text = _CLEAN_TEXT_PATTERN.sub('', text)
-    return _SPEAKER_MARKER_PATTERN.sub(r'\1', text).strip()
+    # Skip regex passes that cannot match (plain-text cues have no tags)
+    if '<' in text:
+        text = _CLEAN_TEXT_PATTERN.sub('', text)
+    return _strip_speaker_markers(text).strip()
 
 
 def _strip_speaker_markers(text: str) -> str:
     """
     Remove speaker markers like '>>' that may prefix cue text.
     """
+    if '>>' not in text and '&gt;&gt;' not in text:
+        return text
     return _SPEAKER_MARKER_PATTERN.sub(r'\1', text)
 
 
+def _finalize_word(
+    syllables_in_word: List[Tuple[str, str]],
+    words_with_timestamps: List[Dict[str, str]]
+) -> None:
+    """
+    Join a word's syllables and append it with its middle timestamp.
+    
+    Args:
+        syllables_in_word: List of (timestamp_str, text) tuples for one word
+        words_with_timestamps: Word list to append the finished word to
+    """
+    if not syllables_in_word:
+        return
+    word_text = ''.join([s[1] for s in syllables_in_word]).strip()
+    if word_text:
+        middle_timestamp = _calculate_middle_timestamp(syllables_in_word)
+        words_with_timestamps.append({
+            "word": word_text,
+            "time": middle_timestamp
+        })
+
+
 def _parse_word_timestamps(
     text_content: str,
     cue_start_seconds: float,
@@ -333,7 +423,8 @@ def _parse_word_timestamps(
     start_time: str,
     rebuild_cues_from_words: bool,
     has_emitted_words: bool,
-    previous_words: Optional[List[Dict[str, str]]] = None
+    previous_words: Optional[List[Dict[str, str]]] = None,
+    clean_text: Optional[str] = None
 ) -> List[Dict[str, str]]:
     """
     Extract word-level timestamps from VTT text content.
@@ -346,22 +437,35 @@ def _parse_word_timestamps(
         rebuild_cues_from_words: Whether rebuilding cues from words
         has_emitted_words: Whether words have been emitted previously
         previous_words: Previously emitted words for overlap trimming when rebuilding
+        clean_text: Already cleaned text_content, reused by the plain-text fallback
         
     Returns:
         List of word dictionaries with 'word' and 'time' keys
     """
-    text_content = _strip_speaker_markers(text_content)
+    stripped_content = _strip_speaker_markers(text_content)
+    if stripped_content != text_content:
+        # Cleaning the stripped text can differ from the caller's clean text
+        clean_text = None
+    text_content = stripped_content
     words_with_timestamps = []
     syllables_in_word = []
-    matches = list(_TAG_PATTERN.finditer(text_content))
+    first_match = _TAG_PATTERN.search(text_content) if '<' in text_content else None
 
     def _trim_duplicate_prefix(prefix_tokens: List[str], keep_last_token: bool) -> List[str]:
         if not prefix_tokens or not previous_words:
             return prefix_tokens
 
-        previous_tokens = [w["word"] for w in previous_words if "word" in w]
+        # Only the last len(prefix_tokens) previous tokens can overlap, so walk
+        # back from the end instead of rebuilding the whole word history per cue
+        previous_tokens = []
+        for previous_word in reversed(previous_words):
+            if "word" in previous_word:
+                previous_tokens.append(previous_word["word"])
+                if len(previous_tokens) == len(prefix_tokens):
+                    break
         if not previous_tokens:
             return prefix_tokens
+        previous_tokens.reverse()
 
         max_overlap = min(len(prefix_tokens), len(previous_tokens))
         if keep_last_token and max_overlap == len(prefix_tokens):
@@ -382,20 +486,6 @@ def _parse_word_timestamps(
         if not rebuild_cues_from_words or len(words_with_timestamps) < 2:
             return
 
-        def _timestamp_to_millis(timestamp: str) -> int:
-            hours, minutes, seconds = timestamp.split(":")
-            sec, millis = seconds.split(".")
-            total_seconds = int(hours) * 3600 + int(minutes) * 60 + int(sec)
-            return total_seconds * 1000 + int(millis)
-
-        def _millis_to_timestamp(total_millis: int) -> str:
-            hours = total_millis // 3_600_000
-            minutes = (total_millis % 3_600_000) // 60_000
-            seconds = (total_millis % 60_000) // 1000
-            millis = total_millis % 1000
-            hours_str = f"{hours:02d}" if hours < 100 else str(hours)
-            return f"{hours_str}:{minutes:02d}:{seconds:02d}.{millis:03d}"
-
         max_millis = int(round(cue_end_seconds * 1000))
         prev_millis = _timestamp_to_millis(words_with_timestamps[0]["time"])
         for word in words_with_timestamps[1:]:
@@ -407,21 +497,10 @@ def _parse_word_timestamps(
                     current_millis = adjusted_millis
             prev_millis = current_millis
     
-    def finalize_word():
-        if not syllables_in_word:
-            return
-        word_text = ''.join([s[1] for s in syllables_in_word]).strip()
-        if word_text:
-            middle_timestamp = _calculate_middle_timestamp(syllables_in_word)
-            words_with_timestamps.append({
-                "word": word_text,
-                "time": middle_timestamp
-            })
-    
     inner_base_seconds = 0.0
-    if matches:
-        first_tag_text = matches[0].group(2)
-        first_tag_seconds = timestamp_to_seconds(matches[0].group(1))
+    if first_match:
+        first_tag_text = first_match.group(2)
+        first_tag_seconds = timestamp_to_seconds(first_match.group(1))
 
         cue_duration = max(0.0, cue_end_seconds - cue_start_seconds)
         # Detect cue-relative timestamps (typically near zero and before cue start).
@@ -432,7 +511,7 @@ def _parse_word_timestamps(
         else:
             inner_base_seconds = 0.0
         
-        text_before_first_tag = text_content[:matches[0].start()]
+        text_before_first_tag = text_content[:first_match.start()]
         text_before_first_tag = text_before_first_tag.replace("\n", " ")
         has_trailing_space_before_tag = bool(text_before_first_tag and text_before_first_tag[-1].isspace())
         text_before_first_tag = text_before_first_tag.rstrip()
@@ -468,10 +547,9 @@ def _parse_word_timestamps(
                         if prefix_tokens:
                             syllables_in_word = [(start_time, prefix_tokens[-1])]
         
-        # Process all timestamp + text pairs
-        for match in matches:
-            timestamp = match.group(1)
-            text = match.group(2)
+        # Process all timestamp + text pairs, taken as plain tuples straight
+        # from the regex engine (no per-tag match objects or group() calls)
+        for timestamp, text in _TAG_PATTERN.findall(text_content, first_match.start()):
             resolved_timestamp = _resolve_inner_timestamp(
                 timestamp,
                 inner_base_seconds,
@@ -481,7 +559,7 @@ def _parse_word_timestamps(
             has_trailing_space = text.endswith(' ')
             
             if has_leading_space:
-                finalize_word()
+                _finalize_word(syllables_in_word, words_with_timestamps)
                 syllables_in_word = []
                 text = text.lstrip()
             
@@ -489,15 +567,16 @@ def _parse_word_timestamps(
                 syllables_in_word.append((resolved_timestamp, text))
             
             if has_trailing_space:
-                finalize_word()
+                _finalize_word(syllables_in_word, words_with_timestamps)
                 syllables_in_word = []
         
         # Add the last word if exists
-        finalize_word()
+        _finalize_word(syllables_in_word, words_with_timestamps)
     
     # Fallback: if no words extracted, split clean text by spaces
     if not words_with_timestamps:
-        clean_text = _clean_text(text_content)
+        if clean_text is None:
+            clean_text = _clean_text(text_content)
         fallback_tokens = clean_text.strip().split()
         if rebuild_cues_from_words and has_emitted_words and fallback_tokens:
             fallback_tokens = _trim_duplicate_prefix(fallback_tokens, keep_last_token=False)
@@ -512,63 +591,60 @@ def _parse_word_timestamps(
     return words_with_timestamps
 
 
-def parse_vtt_content(
-    vtt_content: str,
-    max_cue_duration: float = DEFAULT_MAX_CUE_DURATION,
-    clean_content: bool = True,
-    rebuild_cues_from_words: bool = False
-) -> Dict[str, Any]:
+def _iter_blocks(content: str) -> Iterator[str]:
     """
-    Parse VTT content and ensure cues are under max_cue_duration seconds.
+    Lazily split content on empty lines.
+    
+    Yields the same blocks as content.split("\\n\\n") without building the list.
     
     Args:
-        vtt_content: VTT file content as string
+        content: VTT content as string
+        
+    Yields:
+        Blocks of content, possibly empty
+    """
+    start = 0
+    while True:
+        end = content.find("\n\n", start)
+        if end < 0:
+            yield content[start:]
+            return
+        yield content[start:end]
+        start = end + 2
+
+
+def _parse_cue_blocks(
+    block_lines: Iterable[List[str]],
+    max_cue_duration: float,
+    rebuild_cues_from_words: bool
+) -> List[Dict[str, Any]]:
+    """
+    Parse cue blocks into cues with word-level timestamps.
+    
+    Args:
+        block_lines: Iterable of cue blocks, each given as a list of its lines
         max_cue_duration: Maximum duration in seconds for each cue
-        clean_content: Whether to clean VTT content before parsing
         rebuild_cues_from_words: If True, cues are rebuilt from word-level timestamps
         
     Returns:
-        Dictionary with 'header' and 'cues' keys
-        
-    Raises:
-        ValueError: If VTT content is empty or invalid format
+        List of cue dictionaries
     """
-    # Validate input
-    if not vtt_content or not vtt_content.strip():
-        raise ValueError("VTT content cannot be empty")
-    
-    if not vtt_content.strip().startswith("WEBVTT"):
-        raise ValueError("Invalid VTT format: must start with 'WEBVTT'")
-    
-    # Clean the VTT content if requested
-    if clean_content:
-        vtt_content = clean_vtt_content(vtt_content)
-    
-    # Split the content by empty lines to separate header and cues
-    blocks = vtt_content.strip().split("\n\n")
-    
-    # Extract header using helper function
-    header_lines = blocks[0].split("\n")
-    header = _extract_header(header_lines)
-    
-    # Extract cues
+    # Extract cues, keeping their times in seconds for the split pass
     cues = []
+    cue_seconds = []
     all_words = []
     has_emitted_words = False
     
-    for block in blocks[1:]:
-        if not block.strip():
-            continue
-            
-        lines = block.strip().split('\n')
+    for lines in block_lines:
         if len(lines) < 2:
             continue
             
         # Extract timestamp line
         timestamp_line = lines[0]
         
-        # Check if the first line is a timestamp, otherwise it's an identifier
-        timestamp_match = _TIMESTAMP_PATTERN.search(timestamp_line)
+        # Check if the first line is a timestamp, otherwise it's an identifier.
+        # A timestamp line must contain the arrow, so test for it before the regex
+        timestamp_match = ' --> ' in timestamp_line and _TIMESTAMP_PATTERN.search(timestamp_line)
         
         if timestamp_match:
             timestamp_index = 0
@@ -577,7 +653,9 @@ def parse_vtt_content(
             timestamp_index = 1
             if len(lines) > 1:
                 timestamp_line = lines[1]
-                timestamp_match = _TIMESTAMP_PATTERN.search(timestamp_line)
+                timestamp_match = (
+                    ' --> ' in timestamp_line and _TIMESTAMP_PATTERN.search(timestamp_line)
+                )
         
         if not timestamp_match:
             continue
@@ -591,6 +669,9 @@ def parse_vtt_content(
         text_lines = lines[timestamp_index+1:]
         text_content = ' '.join(text_lines)
         
+        # Clean text (remove all tags); only needed for per-cue output
+        clean_text = None if rebuild_cues_from_words else _clean_text(text_content)
+        
         # Extract word-level timestamps using helper function
         words_with_timestamps = _parse_word_timestamps(
             text_content,
@@ -599,14 +680,12 @@ def parse_vtt_content(
             start_time,
             rebuild_cues_from_words,
             has_emitted_words,
-            previous_words=all_words if rebuild_cues_from_words else None
+            previous_words=all_words if rebuild_cues_from_words else None,
+            clean_text=clean_text
         )
 
         if words_with_timestamps:
             has_emitted_words = True
-                
-        # Clean text (remove all tags)
-        clean_text = _clean_text(text_content)
         
         if rebuild_cues_from_words:
             all_words.extend(words_with_timestamps)
@@ -618,16 +697,101 @@ def parse_vtt_content(
                 'words': words_with_timestamps
             }
             cues.append(cue)
+            cue_seconds.append((cue_start_seconds, cue_end_seconds))
     
     # Split long cues into shorter ones if needed
     if rebuild_cues_from_words:
-        final_cues = build_cues_from_words(all_words, max_cue_duration)
+        return build_cues_from_words(all_words, max_cue_duration)
+    return _split_long_cues(cues, cue_seconds, max_cue_duration)
+
+
+def parse_vtt_content(
+    vtt_content: str,
+    max_cue_duration: float = DEFAULT_MAX_CUE_DURATION,
+    clean_content: bool = True,
+    rebuild_cues_from_words: bool = False
+) -> Dict[str, Any]:
+    """
+    Parse VTT content and ensure cues are under max_cue_duration seconds.
+    
+    Args:
+        vtt_content: VTT file content as string
+        max_cue_duration: Maximum duration in seconds for each cue
+        clean_content: Whether to clean VTT content before parsing
+        rebuild_cues_from_words: If True, cues are rebuilt from word-level timestamps
+        
+    Returns:
+        Dictionary with 'header' and 'cues' keys
+        
+    Raises:
+        ValueError: If VTT content is empty or invalid format
+    """
+    # Validate input
+    stripped_content = vtt_content.strip() if vtt_content else ''
+    if not stripped_content:
+        raise ValueError("VTT content cannot be empty")
+    
+    if not stripped_content.startswith("WEBVTT"):
+        raise ValueError("Invalid VTT format: must start with 'WEBVTT'")
+    
+    # Clean the VTT content if requested; cue lines are grouped directly
+    # instead of re-joining and re-splitting the cleaned text
+    if clean_content:
+        # Cleaning keeps only cue lines, so no header metadata survives
+        header: Dict[str, str] = {}
+        block_lines: Iterable[List[str]] = _iter_cue_lines(vtt_content.split('\n'))
     else:
-        final_cues = split_long_cues(cues, max_cue_duration)
+        # Walk the content block by block (separated by empty lines); the
+        # first block is the header
+        blocks = _iter_blocks(stripped_content)
+        
+        # Extract header using helper function
+        header_lines = next(blocks).split("\n")
+        header = _extract_header(header_lines)
+        block_lines = (block.split('\n') for block in map(str.strip, blocks) if block)
     
     return {
         'header': header,
-        'cues': final_cues
+        'cues': _parse_cue_blocks(block_lines, max_cue_duration, rebuild_cues_from_words)
+    }
+
+
+def _parse_vtt_lines(
+    lines: Iterable[str],
+    max_cue_duration: float = DEFAULT_MAX_CUE_DURATION,
+    rebuild_cues_from_words: bool = False
+) -> Dict[str, Any]:
+    """
+    Parse VTT lines as they are read, with content cleaning enabled.
+    
+    Equivalent to parse_vtt_content(content, clean_content=True) but consumes
+    the lines lazily, so an open file is parsed without reading it whole.
+    
+    Args:
+        lines: Iterable of raw VTT lines, e.g. an open text file
+        max_cue_duration: Maximum duration in seconds for each cue
+        rebuild_cues_from_words: If True, cues are rebuilt from word-level timestamps
+        
+    Returns:
+        Dictionary with 'header' and 'cues' keys
+        
+    Raises:
+        ValueError: If VTT content is empty or invalid format
+    """
+    lines = iter(lines)
+    for first_line in lines:
+        if first_line.strip():
+            break
+    else:
+        raise ValueError("VTT content cannot be empty")
+    
+    if not first_line.lstrip().startswith("WEBVTT"):
+        raise ValueError("Invalid VTT format: must start with 'WEBVTT'")
+    
+    # Cleaning keeps only cue lines, so no header metadata survives
+    return {
+        'header': {},
+        'cues': _parse_cue_blocks(_iter_cue_lines(lines), max_cue_duration, rebuild_cues_from_words)
     }
 
 
@@ -643,14 +807,53 @@ def format_transcript_with_timestamps(cues: List[Dict[str, Any]]) -> str:
     """
     formatted_lines = []
     for cue in cues:
-        start_time = timestamp_to_seconds(cue["start_time"])
+        # Well-formed start times already hold the fields; take them as-is
+        fields_match = _START_FIELDS_PATTERN.fullmatch(cue["start_time"])
+        if fields_match:
+            hours, minutes, seconds = fields_match.groups()
+            formatted_lines.append(f"[{int(hours):02d}:{minutes}:{seconds}] {cue['text'].strip()}")
+            continue
+        # Otherwise floor to whole seconds once so the divmods run on ints
+        start_time = math.floor(timestamp_to_seconds(cue["start_time"]))
         hours, remainder = divmod(start_time, 3600)
         minutes, seconds = divmod(remainder, 60)
-        timestamp = f"[{int(hours):02d}:{int(minutes):02d}:{int(seconds):02d}]"
-        formatted_lines.append(f"{timestamp} {cue['text'].strip()}")
+        formatted_lines.append(f"[{hours:02d}:{minutes:02d}:{seconds:02d}] {cue['text'].strip()}")
     return "\n".join(formatted_lines)
 
 
+def cues_to_columnar(cues: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Convert cue dictionaries to a columnar layout for compact JSON output.
+    
+    Key names are emitted once in "columns" instead of once per cue; each
+    row holds one cue's values in column order. Words stay as dictionaries.
+    
+    Args:
+        cues: List of cue dictionaries from parsed VTT
+        
+    Returns:
+        Dictionary with "columns" (key names) and "rows" (one list per cue)
+    """
+    return {
+        "columns": list(_CUE_COLUMNS),
+        "rows": [list(_get_cue_row(cue)) for cue in cues],
+    }
+
+
+def cues_from_columnar(columnar: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Convert a columnar cue layout back to a list of cue dictionaries.
+    
+    Args:
+        columnar: Dictionary with "columns" and "rows" as produced by cues_to_columnar
+        
+    Returns:
+        List of cue dictionaries
+    """
+    columns = columnar["columns"]
+    return [dict(zip(columns, row)) for row in columnar["rows"]]
+
+
 def parse_vtt(vtt_file_path: str, max_cue_duration: float = DEFAULT_MAX_CUE_DURATION) -> Tuple[str, Dict[str, Any]]:
     """
     Parse a VTT file and return both the formatted transcript and the structured data.
@@ -667,6 +870,5 @@ def parse_vtt(vtt_file_path: str, max_cue_duration: float = DEFAULT_MAX_CUE_DURA
         ValueError: If VTT file is empty or invalid format
     """
     with open(vtt_file_path, 'r', encoding='utf-8') as f:
-        vtt_content = f.read()
-    result = parse_vtt_content(vtt_content, max_cue_duration)
+        result = _parse_vtt_lines(f, max_cue_duration)
     return format_transcript_with_timestamps(result["cues"]), result
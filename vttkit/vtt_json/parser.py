@@ -9,7 +9,18 @@ import json
 import logging
 from typing import Dict, Any
 
-from .converter import parse_vtt_content, DEFAULT_MAX_CUE_DURATION
+from .converter import (
+    parse_vtt_content,
+    _parse_vtt_lines,
+    cues_to_columnar,
+    DEFAULT_MAX_CUE_DURATION,
+)
+
+# Optional faster JSON encoder (pip install vttkit[fast]); output is identical
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +40,9 @@ class VTTParser:
         output_file: str = "segments.json",
         max_cue_duration: float = DEFAULT_MAX_CUE_DURATION,
         clean_content: bool = True,
-        rebuild_cues_from_words: bool = True
+        rebuild_cues_from_words: bool = True,
+        pretty: bool = False,
+        cues_format: str = "dict"
     ) -> Dict[str, Any]:
         """
         Parse VTT file and generate segments.json with complete transcript.
@@ -40,6 +53,10 @@ class VTTParser:
             max_cue_duration: Maximum duration in seconds for each cue
             clean_content: Whether to clean VTT content before parsing (default: True)
             rebuild_cues_from_words: Rebuild cues from word-level data (default: True)
+            pretty: Indent segments.json for readability instead of writing
+                compact JSON (default: False)
+            cues_format: "dict" writes one object per cue; "columnar" writes
+                key names once plus one row per cue (see cues_to_columnar)
         
         Returns:
             Dictionary containing:
@@ -48,7 +65,7 @@ class VTTParser:
                 
         Raises:
             FileNotFoundError: If VTT file does not exist
-            ValueError: If VTT file is empty or invalid format
+            ValueError: If VTT file is empty or invalid format, or cues_format is unknown
                 
         Example:
             >>> parser = VTTParser()
@@ -58,19 +75,29 @@ class VTTParser:
             ... )
             >>> print(f"Parsed {result['cues_count']} cues")
         """
+        if cues_format not in ("dict", "columnar"):
+            raise ValueError(
+                f"Unknown cues_format: {cues_format!r} (expected 'dict' or 'columnar')"
+            )
+        
         logger.info(f"Parsing VTT file: {vtt_file}")
         
-        # Load VTT content from file
         with open(vtt_file, 'r', encoding='utf-8') as f:
-            vtt_content = f.read()
-        
-        # Parse VTT content using core parser
-        parsed_data = parse_vtt_content(
-            vtt_content,
-            max_cue_duration=max_cue_duration,
-            clean_content=clean_content,
-            rebuild_cues_from_words=rebuild_cues_from_words
-        )
+            if clean_content:
+                # Stream the file through the core parser line by line
+                parsed_data = _parse_vtt_lines(
+                    f,
+                    max_cue_duration=max_cue_duration,
+                    rebuild_cues_from_words=rebuild_cues_from_words
+                )
+            else:
+                # Block splitting needs the whole content
+                parsed_data = parse_vtt_content(
+                    f.read(),
+                    max_cue_duration=max_cue_duration,
+                    clean_content=False,
+                    rebuild_cues_from_words=rebuild_cues_from_words
+                )
         
         header = parsed_data['header']
         cues = parsed_data['cues']
@@ -78,12 +105,17 @@ class VTTParser:
         # Format as segments.json structure
         segments_data = {
             "header": header,
-            "cues": cues
+            "cues": cues_to_columnar(cues) if cues_format == "columnar" else cues
         }
         
         # Save segments.json
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(segments_data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(segments_data, option=orjson.OPT_INDENT_2 if pretty else 0))
+        else:
+            json_kwargs = {'indent': 2} if pretty else {'separators': (',', ':')}
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(segments_data, f, ensure_ascii=False, **json_kwargs)
 
         logger.info(f"VTT parsing complete: {len(cues)} cues extracted")
         
@@ -5,16 +5,26 @@ Provides YouTube-specific functionality using yt-dlp for subtitle extraction
 and live stream information retrieval.
 """
 
+import asyncio
 import logging
 import os
 import re
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
 import yt_dlp
 
 logger = logging.getLogger(__name__)
 
+# Pre-compiled YouTube URL pattern; the only capture group is the video ID
+_YOUTUBE_URL_PATTERN = re.compile(
+    r'^(?:https?://)?(?:www\.)?'
+    r'(?:youtube\.com/watch\?v=|youtu\.be/)([^\s&]+)'
+)
+
+# Caption languages tried first when picking a live VTT URL
+_PREFERRED_CAPTION_LANGS = ('en', 'en-orig', 'en-US', 'en-GB')
+
 
 def is_youtube_url(url: str) -> bool:
     """
@@ -32,8 +42,10 @@ def is_youtube_url(url: str) -> bool:
         >>> is_youtube_url("https://example.com/video")
         False
     """
-    youtube_regex = r'^(https?://)?(www\.)?(youtube\.com/watch\?v=|youtu\.be/)([^\s&]+)'
-    return bool(re.match(youtube_regex, url))
+    # Every accepted form contains "youtu"; skip the regex for other URLs
+    if "youtu" not in url:
+        return False
+    return _YOUTUBE_URL_PATTERN.match(url) is not None
 
 
 def extract_youtube_id(url: str) -> Optional[str]:
@@ -50,9 +62,52 @@ def extract_youtube_id(url: str) -> Optional[str]:
         >>> extract_youtube_id("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
         'dQw4w9WgXcQ'
     """
-    youtube_regex = r'^(https?://)?(www\.)?(youtube\.com/watch\?v=|youtu\.be/)([^\s&]+)'
-    match = re.match(youtube_regex, url)
-    return match.group(4) if match else None
+    if "youtu" not in url:
+        return None
+    match = _YOUTUBE_URL_PATTERN.match(url)
+    return match.group(1) if match else None
+
+
+def _first_vtt_url(formats: List[Dict[str, str]]) -> Optional[str]:
+    """
+    Return the URL of the first VTT entry in a caption format list.
+    
+    Args:
+        formats: yt-dlp caption formats for one language
+        
+    Returns:
+        URL of the first format with ext 'vtt', or None
+    """
+    for fmt in formats:
+        if fmt.get('ext') == 'vtt':
+            return fmt.get('url')
+    return None
+
+
+def _find_vtt_url(captions: Dict, preferred_langs) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Find a VTT caption URL, trying preferred languages before the rest.
+    
+    Args:
+        captions: yt-dlp captions dict mapping language to format list
+        preferred_langs: Languages to try first, in order (None entries skipped)
+        
+    Returns:
+        Tuple of (language, url), or (None, None) if no VTT URL is available
+    """
+    for lang in preferred_langs:
+        formats = captions.get(lang) if lang else None
+        if formats:
+            vtt_url = _first_vtt_url(formats)
+            if vtt_url:
+                return lang, vtt_url
+    
+    # Fall back to the first language with a VTT format
+    for lang, formats in captions.items():
+        vtt_url = _first_vtt_url(formats)
+        if vtt_url:
+            return lang, vtt_url
+    return None, None
 
 
 class YouTubeClient:
@@ -71,6 +126,16 @@ class YouTubeClient:
             cookies_path: Optional path to cookies file for authentication
         """
         self.cookies_path = cookies_path
+        # Options for info extraction never change between calls, so build
+        # them once; extract_live_info hands yt-dlp a copy because
+        # YoutubeDL mutates the params dict it is given
+        self._info_opts = self._get_ydl_opts(
+            extract_flat=False,
+            writesubtitles=True,
+            writeautomaticsub=True,
+            subtitlesformat='vtt',
+            skip_download=True,
+        )
     
     def _get_ydl_opts(self, **overrides) -> Dict:
         """
@@ -116,13 +181,12 @@ class YouTubeClient:
             ValueError: If URL is not a valid YouTube URL
             Exception: If download fails
         """
-        if not is_youtube_url(url):
-            raise ValueError(f"Invalid YouTube URL: {url}")
-        
         video_id = extract_youtube_id(url)
+        if video_id is None:
+            raise ValueError(f"Invalid YouTube URL: {url}")
         
         try:
-            logger.info(f"Downloading subtitles for YouTube video: {video_id}")
+            logger.info("Downloading subtitles for YouTube video: %s", video_id)
             
             # Ensure output directory exists
             os.makedirs(output_dir, exist_ok=True)
@@ -143,19 +207,30 @@ class YouTubeClient:
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 info = ydl.extract_info(url, download=True)
             
-            # Find the downloaded VTT file
-            vtt_files = list(Path(output_dir).glob(f"{video_id}.*.vtt"))
+            # yt-dlp records where it wrote each subtitle; only scan the
+            # output directory if that information is missing
+            vtt_path = None
+            requested = info.get('requested_subtitles') if info else None
+            for entry in (requested or {}).values():
+                filepath = entry.get('filepath') if entry else None
+                if filepath and filepath.endswith('.vtt'):
+                    vtt_path = filepath
+                    break
             
-            if vtt_files:
-                vtt_path = str(vtt_files[0])
-                logger.info(f"Successfully downloaded subtitles to: {vtt_path}")
+            if vtt_path is None:
+                vtt_files = list(Path(output_dir).glob(f"{video_id}.*.vtt"))
+                if vtt_files:
+                    vtt_path = str(vtt_files[0])
+            
+            if vtt_path:
+                logger.info("Successfully downloaded subtitles to: %s", vtt_path)
                 return vtt_path
             else:
-                logger.warning(f"No VTT files found for {video_id}")
+                logger.warning("No VTT files found for %s", video_id)
                 return None
                 
         except Exception as e:
-            logger.error(f"Failed to download YouTube subtitles: {str(e)}")
+            logger.error("Failed to download YouTube subtitles: %s", e)
             raise Exception(f"YouTube subtitle download failed: {str(e)}")
     
     def extract_live_info(self, url: str) -> Dict:
@@ -183,24 +258,15 @@ class YouTubeClient:
             ValueError: If URL is not a valid YouTube URL
             Exception: If extraction fails
         """
-        if not is_youtube_url(url):
-            raise ValueError(f"Invalid YouTube URL: {url}")
-        
         video_id = extract_youtube_id(url)
+        if video_id is None:
+            raise ValueError(f"Invalid YouTube URL: {url}")
         
         try:
-            logger.info(f"Extracting live stream info for: {video_id}")
+            logger.info("Extracting live stream info for: %s", video_id)
             
-            # Configure yt-dlp options for info extraction only
-            ydl_opts = self._get_ydl_opts(
-                extract_flat=False,
-                writesubtitles=True,
-                writeautomaticsub=True,
-                subtitlesformat='vtt',
-                skip_download=True,
-            )
-            
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            # Info extraction only, using the options prepared in __init__
+            with yt_dlp.YoutubeDL(dict(self._info_opts)) as ydl:
                 info = ydl.extract_info(url, download=False)
             
             # Extract VTT URL from subtitles
@@ -211,15 +277,13 @@ class YouTubeClient:
                 if not captions:
                     captions = info.get('subtitles', {})
                 
-                # Look for any language with VTT format
-                for lang, formats in captions.items():
-                    for fmt in formats:
-                        if fmt.get('ext') == 'vtt':
-                            vtt_url = fmt.get('url')
-                            logger.info(f"Found VTT URL for language '{lang}'")
-                            break
-                    if vtt_url:
-                        break
+                # Prefer English (as download_subtitles does), then the
+                # stream's own language, before scanning every language
+                lang, vtt_url = _find_vtt_url(
+                    captions, _PREFERRED_CAPTION_LANGS + (info.get('language'),)
+                )
+                if vtt_url:
+                    logger.info("Found VTT URL for language '%s'", lang)
             
             # Check if stream is live
             is_live = info.get('is_live', False)
@@ -238,14 +302,14 @@ class YouTubeClient:
             }
             
             logger.info(
-                f"Extracted info for {video_id}: "
-                f"is_live={is_live}, has_vtt={vtt_url is not None}"
+                "Extracted info for %s: is_live=%s, has_vtt=%s",
+                video_id, is_live, vtt_url is not None
             )
             
             return result
             
         except Exception as e:
-            logger.error(f"Failed to extract YouTube live info for {url}: {str(e)}")
+            logger.error("Failed to extract YouTube live info for %s: %s", url, e)
             raise Exception(f"YouTube info extraction failed: {str(e)}")
     
     def is_live_active(self, url: str) -> bool:
@@ -262,7 +326,7 @@ class YouTubeClient:
             info = self.extract_live_info(url)
             return info.get('is_live', False)
         except Exception as e:
-            logger.error(f"Failed to check YouTube live status: {str(e)}")
+            logger.error("Failed to check YouTube live status: %s", e)
             # If we can't check, assume it's still live to avoid premature finalization
             logger.warning("Assuming stream is still live due to check failure")
             return True
@@ -281,7 +345,7 @@ class YouTubeClient:
             Fresh VTT URL, or None if not available
         """
         try:
-            logger.info(f"Refreshing VTT URL for YouTube stream")
+            logger.info("Refreshing VTT URL for YouTube stream")
             info = self.extract_live_info(url)
             vtt_url = info.get('vtt_url')
             
@@ -293,5 +357,40 @@ class YouTubeClient:
             return vtt_url
             
         except Exception as e:
-            logger.error(f"Failed to refresh VTT URL: {str(e)}")
+            logger.error("Failed to refresh VTT URL: %s", e)
             return None
+    
+    async def aextract_live_info(self, url: str) -> Dict:
+        """
+        Async variant of extract_live_info for batch workloads.
+        
+        Runs the blocking yt-dlp call in the default executor so that several
+        streams can be queried concurrently. Each call builds its own
+        YoutubeDL instance, so concurrent calls share no extractor state.
+        
+        Args:
+            url: YouTube live stream URL
+            
+        Returns:
+            Dictionary with stream information (see extract_live_info)
+            
+        Raises:
+            ValueError: If URL is not a valid YouTube URL
+            Exception: If extraction fails
+        """
+        # asyncio.to_thread needs Python 3.9; run_in_executor works on 3.8
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.extract_live_info, url)
+    
+    async def arefresh_vtt_url(self, url: str) -> Optional[str]:
+        """
+        Async variant of refresh_vtt_url for batch workloads.
+        
+        Args:
+            url: YouTube stream URL
+            
+        Returns:
+            Fresh VTT URL, or None if not available
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.refresh_vtt_url, url)
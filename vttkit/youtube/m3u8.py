@@ -6,12 +6,110 @@ particularly useful for YouTube live streams that require timestamp correction.
 """
 
 import logging
-from typing import Dict, Optional
+import re
+import threading
+import time
+from collections import OrderedDict
+from http.cookiejar import DefaultCookiePolicy
+from typing import Dict, Iterator, Optional, Tuple, cast
 
 import requests
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
+# Segment duration assumed when a playlist has no usable EXTINF tags
+_DEFAULT_SEGMENT_DURATION = 5.0
+
+# Shared connection pool so repeated playlist polls reuse keep-alive
+# connections instead of paying a TCP/TLS handshake each time. urllib3 pools
+# are thread-safe; requests.Session is not, so each thread gets its own
+_HTTP_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+_THREAD_SESSIONS = threading.local()
+# Playlist polls are stateless, like plain requests.get: never keep cookies
+_NO_COOKIES_POLICY = DefaultCookiePolicy(allowed_domains=[])
+
+# ".m3u8" at the end of the URL or right before its query string
+_M3U8_URL_PATTERN = re.compile(r'\.m3u8(?:\?|\Z)', re.IGNORECASE)
+
+# Parsed playlist info keyed by URL, stored as (etag, last_modified, info,
+# expires_at) so re-polls can be answered by a 304 without parsing
+_M3U8_CACHE_SIZE = 32
+_M3U8_CACHE: "OrderedDict[str, tuple]" = OrderedDict()
+# Concurrent pollers share the cache, so every access goes through this lock
+_M3U8_CACHE_LOCK = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """
+    Return this thread's playlist session, creating it on first use.
+    
+    Returns:
+        Session that shares the module connection pool and stores no cookies
+    """
+    session = getattr(_THREAD_SESSIONS, 'session', None)
+    if session is None:
+        session = requests.Session()
+        session.cookies.set_policy(_NO_COOKIES_POLICY)
+        session.mount('https://', _HTTP_ADAPTER)
+        session.mount('http://', _HTTP_ADAPTER)
+        _THREAD_SESSIONS.session = session
+    return session
+
+
+def _lookup_m3u8_cache(m3u8_url: str) -> Tuple[Dict[str, str], Optional[Dict]]:
+    """
+    Build conditional request headers from a cached playlist entry.
+    
+    Args:
+        m3u8_url: URL to M3U8 playlist
+        
+    Returns:
+        Tuple of (If-None-Match / If-Modified-Since headers, cached info);
+        ({}, None) if nothing usable is cached
+    """
+    with _M3U8_CACHE_LOCK:
+        cached = _M3U8_CACHE.get(m3u8_url)
+        if cached is None:
+            return {}, None
+        
+        etag, last_modified, info, expires_at = cached
+        if time.monotonic() >= expires_at:
+            del _M3U8_CACHE[m3u8_url]
+            return {}, None
+    
+    headers = {}
+    if etag:
+        headers['If-None-Match'] = etag
+    if last_modified:
+        headers['If-Modified-Since'] = last_modified
+    return headers, info
+
+
+def _cache_m3u8_info(m3u8_url: str, response_headers, info: Dict) -> None:
+    """
+    Remember parsed playlist info if the server supports validation.
+    
+    Entries expire after two segment durations, after which the playlist
+    has moved on and a full fetch is needed anyway.
+    
+    Args:
+        m3u8_url: URL to M3U8 playlist
+        response_headers: Headers of the 200 response
+        info: Parsed playlist info
+    """
+    etag = response_headers.get('ETag')
+    last_modified = response_headers.get('Last-Modified')
+    if not etag and not last_modified:
+        return
+    
+    expires_at = time.monotonic() + 2 * info['segment_duration']
+    with _M3U8_CACHE_LOCK:
+        _M3U8_CACHE[m3u8_url] = (etag, last_modified, dict(info), expires_at)
+        _M3U8_CACHE.move_to_end(m3u8_url)
+        while len(_M3U8_CACHE) > _M3U8_CACHE_SIZE:
+            _M3U8_CACHE.popitem(last=False)
+
 
 def extract_m3u8_info(m3u8_url: str, timeout: int = 30, verify_ssl: bool = False) -> Dict[str, any]:
     """
@@ -22,6 +120,10 @@ def extract_m3u8_info(m3u8_url: str, timeout: int = 30, verify_ssl: bool = False
     - MEDIA-SEQUENCE: Segment number in the stream
     - EXTINF durations: Segment durations
     
+    Results are cached per URL when the server sends an ETag or
+    Last-Modified header; re-polls send a conditional request and reuse
+    the cached info on 304 Not Modified.
+    
     Args:
         m3u8_url: URL to M3U8 playlist
         timeout: Request timeout in seconds (default: 30)
@@ -36,51 +138,80 @@ def extract_m3u8_info(m3u8_url: str, timeout: int = 30, verify_ssl: bool = False
         1234 5.0
     """
     try:
-        response = requests.get(m3u8_url, timeout=timeout, verify=verify_ssl)
-        response.raise_for_status()
-        
         program_time = None
         media_sequence = None
         segment_durations = []
         
-        for line in response.text.split('\n'):
-            line = line.strip()
-            
-            if line.startswith('#EXT-X-PROGRAM-DATE-TIME:'):
-                program_time = line.split(':', 1)[1].strip()
-                logger.debug(f"Found PROGRAM-DATE-TIME: {program_time}")
+        headers, cached_info = _lookup_m3u8_cache(m3u8_url)
+        
+        # Stream the playlist line by line instead of decoding and splitting
+        # the whole body up front
+        session = _get_session()
+        with session.get(m3u8_url, timeout=timeout, verify=verify_ssl, stream=True,
+                         headers=headers or None) as response:
+            if cached_info is not None and response.status_code == 304:
+                logger.debug("M3U8 playlist not modified, using cached info")
+                # Read the empty body so closing the response hands the
+                # keep-alive connection back to the pool
+                response.content
+                return dict(cached_info)
             
-            elif line.startswith('#EXT-X-MEDIA-SEQUENCE:'):
-                media_sequence = int(line.split(':', 1)[1].strip())
-                logger.debug(f"Found MEDIA-SEQUENCE: {media_sequence}")
+            response.raise_for_status()
+            # M3U8 playlists are UTF-8 (RFC 8216); without an encoding,
+            # iter_lines would yield bytes
+            if response.encoding is None:
+                response.encoding = 'utf-8'
             
-            elif line.startswith('#EXTINF:'):
-                # Extract duration from #EXTINF:5.005, format
-                duration_str = line.split(':', 1)[1].split(',')[0].strip()
-                try:
-                    segment_durations.append(float(duration_str))
-                except ValueError:
-                    pass
-        
-        # Calculate average segment duration
-        avg_duration = sum(segment_durations) / len(segment_durations) if segment_durations else 5.0
-        
-        result = {
-            'program_time': program_time,
-            'media_sequence': media_sequence,
-            'segment_duration': avg_duration,
-        }
-        
-        logger.info(f"M3U8 info: sequence={media_sequence}, avg_duration={avg_duration:.3f}s")
-        return result
+            # With an encoding set, iter_lines yields str only
+            lines = cast(Iterator[str], response.iter_lines(decode_unicode=True))
+            for line in lines:
+                # Split the tag name off once and compare it whole; EXTINF
+                # is by far the most common tag, so it is checked first
+                tag, sep, value = line.strip().partition(':')
+                if not sep:
+                    continue
+                
+                if tag == '#EXTINF':
+                    # Extract duration from #EXTINF:5.005, format
+                    duration_str = value.partition(',')[0].strip()
+                    try:
+                        segment_durations.append(float(duration_str))
+                    except ValueError:
+                        pass
+                
+                elif tag == '#EXT-X-PROGRAM-DATE-TIME':
+                    program_time = value.strip()
+                    logger.debug("Found PROGRAM-DATE-TIME: %s", program_time)
+                
+                elif tag == '#EXT-X-MEDIA-SEQUENCE':
+                    media_sequence = int(value.strip())
+                    logger.debug("Found MEDIA-SEQUENCE: %s", media_sequence)
         
     except Exception as e:
-        logger.warning(f"Failed to extract M3U8 info: {str(e)}")
+        logger.warning("Failed to extract M3U8 info: %s", e)
         return {
             'program_time': None,
             'media_sequence': None,
-            'segment_duration': 5.0
+            'segment_duration': _DEFAULT_SEGMENT_DURATION
         }
+    
+    # Calculate average segment duration
+    if segment_durations:
+        avg_duration = sum(segment_durations) / len(segment_durations)
+    else:
+        avg_duration = _DEFAULT_SEGMENT_DURATION
+    
+    result = {
+        'program_time': program_time,
+        'media_sequence': media_sequence,
+        'segment_duration': avg_duration,
+    }
+    
+    # Cache outside the try so a successful fetch is never reported as a failure
+    _cache_m3u8_info(m3u8_url, response.headers, result)
+    
+    logger.info("M3U8 info: sequence=%s, avg_duration=%.3fs", media_sequence, avg_duration)
+    return result
 
 
 def extract_m3u8_program_date_time(m3u8_url: str) -> Optional[str]:
@@ -115,4 +246,4 @@ def is_m3u8_url(url: str) -> bool:
     Returns:
         True if URL appears to be an M3U8 playlist, False otherwise
     """
-    return url.lower().endswith('.m3u8') or '.m3u8?' in url.lower()
+    return _M3U8_URL_PATTERN.search(url) is not None